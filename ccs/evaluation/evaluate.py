@@ -9,6 +9,7 @@ from simple_parsing.helpers import field
 from ..files import ccs_reporter_dir
 from ..metrics import evaluate_preds, get_logprobs
 from ..run import Run
+from ..training import load_reporter
 from ..utils import Color
 
 
@@ -39,7 +40,19 @@ class Eval(Run):
         experiment_dir = ccs_reporter_dir() / self.source
 
         reporter_path = experiment_dir / "reporters" / f"layer_{layer}.pt"
-        reporter = torch.load(reporter_path, map_location=device)
+        reporter = load_reporter(reporter_path, map_location=device)
+
+        # Load the supervised models once per layer, not once per ensembling mode;
+        # repeatedly deserializing the same checkpoint is pure overhead.
+        lr_models = []
+        lr_dir = experiment_dir / "lr_models"
+        if not self.skip_supervised and lr_dir.exists():
+            with open(lr_dir / f"layer_{layer}.pt", "rb") as f:
+                # Trusted local checkpoints of whole Classifier modules, which
+                # torch >= 2.6's default weights-only unpickler rejects.
+                lr_models = torch.load(f, map_location=device, weights_only=False)
+                if not isinstance(lr_models, list):  # backward compatibility
+                    lr_models = [lr_models]
 
         out_logprobs = defaultdict(dict)
         row_bufs = defaultdict(list)
@@ -57,6 +70,13 @@ class Eval(Run):
                 )
 
             val_credences = reporter(val_data.hiddens)
+
+            # Compute the supervised credences once per model, not once per
+            # ensembling mode; evaluate_preds doesn't modify its inputs.
+            for model in lr_models:
+                model.eval()
+            lr_val_credences = [model(val_data.hiddens) for model in lr_models]
+
             for mode in ("none", "partial", "full"):
                 row_bufs["eval"].append(
                     {
@@ -87,22 +107,14 @@ class Eval(Run):
                             val_data.lm_preds, mode
                         ).cpu()
 
-                lr_dir = experiment_dir / "lr_models"
-                if not self.skip_supervised and lr_dir.exists():
-                    with open(lr_dir / f"layer_{layer}.pt", "rb") as f:
-                        lr_models = torch.load(f, map_location=device)
-                        if not isinstance(lr_models, list):  # backward compatibility
-                            lr_models = [lr_models]
-
+                if lr_models:
                     if self.save_logprobs:
                         out_logprobs[ds_name]["lr"][mode] = dict()
 
-                    for i, model in enumerate(lr_models):
-                        model.eval()
-                        val_credences = model(val_data.hiddens)
+                    for i, credences in enumerate(lr_val_credences):
                         if self.save_logprobs:
                             out_logprobs[ds_name]["lr"][mode][i] = get_logprobs(
-                                val_credences, mode
+                                credences, mode
                             ).cpu()
                         row_bufs["lr_eval"].append(
                             {
@@ -110,7 +122,7 @@ class Eval(Run):
                                 "inlp_iter": i,
                                 **meta,
                                 **evaluate_preds(
-                                    val_data.labels, val_credences, mode
+                                    val_data.labels, credences, mode
                                 ).to_dict(),
                             }
                         )
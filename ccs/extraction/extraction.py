@@ -23,7 +23,7 @@ from datasets import (
 )
 from simple_parsing import Serializable, field
 from torch import Tensor
-from transformers import AutoConfig, PreTrainedModel
+from transformers import PreTrainedModel
 
 from ..promptsource import DatasetTemplates
 from ..utils import (
@@ -31,12 +31,12 @@ from ..utils import (
     assert_type,
     colorize,
     float_to_int16,
+    get_model_config,
     infer_label_column,
     infer_num_classes,
     instantiate_model,
     instantiate_tokenizer,
     is_autoregressive,
-    prevent_name_conflicts,
     select_split,
     select_train_val_splits,
     select_usable_devices,
@@ -65,6 +65,9 @@ class Extract(Serializable):
     binarize: bool = False
     """Whether to binarize the dataset labels for multi-class datasets."""
 
+    compile: bool = False
+    """Whether to compile the model's forward pass with `torch.compile`."""
+
     int8: bool = False
     """Whether to perform inference in mixed int8 precision with `bitsandbytes`."""
 
@@ -131,12 +134,10 @@ class Extract(Serializable):
                 "Cannot use both --layers and --layer-stride. Please use only one."
             )
         elif layer_stride > 1:
-            from transformers import AutoConfig, PretrainedConfig
+            from transformers import PretrainedConfig
 
             # Look up the model config to get the number of layers
-            config = assert_type(
-                PretrainedConfig, AutoConfig.from_pretrained(self.model)
-            )
+            config = assert_type(PretrainedConfig, get_model_config(self.model))
             # Note that we always include 0 which is the embedding layer
             layer_range = range(1, config.num_hidden_layers + 1, layer_stride)
             self.layers = (0,) + tuple(layer_range)
@@ -177,6 +178,15 @@ def extract_hiddens(
             cfg.model, truncation_side="left", verbose=rank == 0
         )
 
+    # This is inference only: switch off dropout and the like, and freeze the
+    # parameters so no forward pass ever wires up autograd metadata for them.
+    model.eval()
+    model.requires_grad_(False)
+
+    # We run exactly one forward pass per sequence and never generate, so the
+    # KV cache is pure overhead: skip allocating and writing it.
+    model.config.use_cache = False
+
     is_enc_dec = model.config.is_encoder_decoder
     if is_enc_dec and cfg.use_encoder_states:
         assert hasattr(model, "get_encoder") and callable(model.get_encoder)
@@ -187,6 +197,11 @@ def extract_hiddens(
     if has_lm_preds and rank == 0:
         print("Model has language model head, will store predictions.")
 
+    if cfg.compile:
+        # Sequence lengths vary per prompt, so compile with dynamic shapes
+        # rather than letting the compiler respecialize on every new length.
+        model = torch.compile(model, dynamic=True)
+
     prompt_ds = load_prompts(
         ds_names[0],
         binarize=cfg.binarize,
@@ -357,8 +372,7 @@ def _extraction_worker(**kwargs):
 
 def hidden_features(cfg: Extract) -> tuple[DatasetInfo, Features]:
     """Return the HuggingFace `Features` corresponding to an `Extract` config."""
-    with prevent_name_conflicts():
-        model_cfg = AutoConfig.from_pretrained(cfg.model)
+    model_cfg = get_model_config(cfg.model)
 
     ds_name, config_name = parse_dataset_string(dataset_config_str=cfg.datasets[0])
     info = get_dataset_config_info(ds_name, config_name or None)
@@ -4,7 +4,7 @@ from typing import Any, Iterator, Literal
 
 from datasets import ClassLabel, Dataset, Value, load_dataset
 
-from ..promptsource import DatasetTemplates
+from ..promptsource import DatasetTemplates, Template
 from ..utils import (
     assert_type,
     infer_label_column,
@@ -55,7 +55,10 @@ def load_prompts(
     ds = ds.shuffle(seed=seed)
 
     if world_size > 1:
-        ds = ds.shard(world_size, rank)
+        # Contiguous shards are zero-copy slices of the arrow table; the default
+        # strided sharding gathers every world_size-th row into a new table.
+        # The dataset is already shuffled above, so each shard is still random.
+        ds = ds.shard(world_size, rank, contiguous=True)
 
     if template_path is None:
         prompter = DatasetTemplates(ds_name, config_name)
@@ -66,7 +69,12 @@ def load_prompts(
     binarize = binarize or prompter.binarize
     prompter.drop_non_mc_templates()
 
-    num_templates = len(prompter.templates)
+    # Sort the templates by name once up front, rather than once per example
+    # inside `_convert_to_prompts`.
+    templates = sorted(prompter.templates.values(), key=lambda t: t.name)
+    template_names = [template.name for template in templates]
+
+    num_templates = len(templates)
     assert num_templates > 0
     if rank == 0:
         print(f"Extracting {num_templates} variants of each prompt")
@@ -114,7 +122,8 @@ def load_prompts(
             binarize=binarize,
             label_column=label_column,
             label_choices=label_choices,  # type: ignore[arg-type]
-            prompter=prompter,
+            templates=templates,
+            template_names=template_names,
             rng=rng,
             fewshot_iter=fewshot_iter,
         )
@@ -122,7 +131,8 @@ def load_prompts(
 
 def _convert_to_prompts(
     example: dict[str, Any],
-    prompter: DatasetTemplates,
+    templates: list[Template],
+    template_names: list[str],
     binarize: bool,
     label_column: str,
     label_choices: list[bool | int | str],
@@ -131,7 +141,6 @@ def _convert_to_prompts(
 ) -> dict[str, Any]:
     """Prompt-generating function to pass to `IterableDataset.map`."""
     prompts = []
-    templates = sorted(list(prompter.templates.values()), key=lambda t: t.name)
 
     def qa_cat(q: str, a: str) -> str:
         # if the jinja template already adds whitespace, don't add more
@@ -193,5 +202,5 @@ def _convert_to_prompts(
         row_id=example["row_id"],
         label=label_choices.index(label),
         prompts=prompts,
-        template_names=[template.name for template in templates],
+        template_names=template_names,
     )
@@ -3,9 +3,20 @@
 import json
 import os
 import random
+from functools import cache
 from pathlib import Path
 
 
+@cache
+def _memorable_name_parts() -> tuple[list[str], list[str]]:
+    """Load and cache the adjective and name lists used by `memorably_named_dir`."""
+    resource_dir = Path(__file__).parent / "resources"
+
+    adjectives = json.loads((resource_dir / "adjectives.json").read_bytes())
+    names = json.loads((resource_dir / "names.json").read_bytes())
+    return adjectives, names
+
+
 def sweeps_dir() -> Path:
     """Return the directory where sweeps are stored."""
     return ccs_reporter_dir() / "sweeps"
@@ -25,12 +36,7 @@ def ccs_reporter_dir() -> Path:
 
 def memorably_named_dir(parent: Path):
     """Return a memorably-named cached directory of the form 'goofy-goodall'."""
-    resource_dir = Path(__file__).parent / "resources"
-
-    with open(resource_dir / "adjectives.json", "r") as f:
-        adjectives = json.load(f)
-    with open(resource_dir / "names.json", "r") as f:
-        names = json.load(f)
+    adjectives, names = _memorable_name_parts()
 
     parent.mkdir(parents=True, exist_ok=True)
     sub_dir = "."
@@ -54,13 +54,29 @@ class CalibrationError:
         pred_probs, indices = pred_probs.sort()
         labels = labels[indices].float()
 
+        # Prefix sums let us get the mean of every bin from a single gather per
+        # candidate binning, instead of stacking b slice means for each b. We
+        # accumulate in double precision so differences of large sums stay exact.
+        label_csums = torch.cat([labels.new_zeros(1), labels.cumsum(0)]).double()
+        edge_idx = torch.arange(n + 1, device=labels.device)
+
+        def bin_edges(b: int) -> Tensor:
+            # Mirrors torch.tensor_split: the first n % b bins have ceil(n / b)
+            # elements and the remaining bins have floor(n / b).
+            size, rem = divmod(n, b)
+            idx = edge_idx[: b + 1]
+            return idx * size + idx.clamp(max=rem)
+
         # Search for the largest number of bins which preserves monotonicity.
         # Based on Algorithm 1 in Roelofs et al. (2020).
         # Using a single bin is guaranteed to be monotonic, so we start there.
         b_star, accs_star = 1, labels.mean().unsqueeze(0)
         for b in range(2, n + 1):
             # Split into (nearly) equal mass bins
-            freqs = torch.stack([h.mean() for h in labels.tensor_split(b)])
+            edges = bin_edges(b)
+            freqs = (label_csums[edges[1:]] - label_csums[edges[:-1]]) / (
+                edges[1:] - edges[:-1]
+            )
 
             # This binning is not strictly monotonic, let's break
             if not torch.all(freqs[1:] > freqs[:-1]):
@@ -76,11 +92,15 @@ class CalibrationError:
 
         # Split into (nearly) equal mass bins. They won't be exactly equal, so we
         # still weight the bins by their size.
-        conf_bins = pred_probs.tensor_split(b_star)
-        w = pred_probs.new_tensor([len(c) / n for c in conf_bins])
+        edges = bin_edges(b_star)
+        sizes = edges[1:] - edges[:-1]
+        w = sizes / n
 
         # See the definition of ECE_sweep in Equation 8 of Roelofs et al. (2020)
-        mean_confs = torch.stack([c.mean() for c in conf_bins])
+        prob_csums = torch.cat(
+            [pred_probs.new_zeros(1), pred_probs.cumsum(0)]
+        ).double()
+        mean_confs = (prob_csums[edges[1:]] - prob_csums[edges[:-1]]) / sizes
         ece = torch.sum(w * torch.abs(accs_star - mean_confs) ** p) ** (1 / p)
 
         return CalibrationEstimate(float(ece), b_star)
@@ -3,7 +3,6 @@ from typing import Any, Literal
 
 import torch
 import torch.nn.functional as F
-from einops import repeat
 from torch import Tensor
 
 from .accuracy import AccuracyResult, accuracy_ci
@@ -91,27 +90,51 @@ def evaluate_preds(
     (n, v, c) = y_logits.shape
     assert y_true.shape == (n,)
 
+    # Build the one-hot labels once from the 1-D ground truth and broadcast
+    # them across variants as a view; the AUROC call sites below used to each
+    # scatter their own (n, v, c) copy from the repeated labels.
+    y_one_hot = to_one_hot(y_true, c).long()
+
     if ensembling == "full":
         y_logits = y_logits.mean(dim=1)
     else:
-        y_true = repeat(y_true, "n -> n v", v=v)
+        # Broadcast the labels across variants as a stride-0 view; nothing
+        # downstream writes to y_true, so no copy is needed.
+        y_true = y_true.unsqueeze(1).expand(n, v)
+        y_one_hot = y_one_hot.unsqueeze(1).expand(n, v, c)
+
+    # Pooled logits of the positive class, computed once up front and shared by the
+    # AUROC and calibration code paths below. Note that in the "none" case the pooled
+    # logits are just the raw positive-class logits, matching the accuracy threshold.
+    pooled_logits = None
+    if c == 2:
+        pooled_logits = (
+            y_logits[..., 1]
+            if ensembling == "none"
+            else y_logits[..., 1] - y_logits[..., 0]
+        )
 
     THRESHOLD = 0.5
     if ensembling == "none":
         y_pred = y_logits[..., 1].gt(THRESHOLD).to(torch.int)
+    elif pooled_logits is not None:
+        # In the binary case argmax over the two logits is just the sign of
+        # their difference, which is already pooled above. Ties resolve to the
+        # negative class either way.
+        y_pred = pooled_logits.gt(0).to(torch.int)
     else:
         y_pred = y_logits.argmax(dim=-1)
 
     acc = accuracy_ci(y_true, y_pred)
 
     if ensembling == "none":
-        auroc = roc_auc_ci(to_one_hot(y_true, c).long().flatten(1), y_logits.flatten(1))
+        auroc = roc_auc_ci(y_one_hot.flatten(1), y_logits.flatten(1))
     elif ensembling in ("partial", "full"):
         # Pool together the negative and positive class logits
-        if c == 2:
-            auroc = roc_auc_ci(y_true, y_logits[..., 1] - y_logits[..., 0])
+        if pooled_logits is not None:
+            auroc = roc_auc_ci(y_true, pooled_logits)
         else:
-            auroc = roc_auc_ci(to_one_hot(y_true, c).long(), y_logits)
+            auroc = roc_auc_ci(y_one_hot, y_logits)
     else:
         raise ValueError(f"Unknown mode: {ensembling}")
 
@@ -119,19 +142,21 @@ def evaluate_preds(
     cal_err = None
     cal_thresh = None
 
-    if c == 2:
-        pooled_logits = (
-            y_logits[..., 1]
-            if ensembling == "none"
-            else y_logits[..., 1] - y_logits[..., 0]
-        )
-        pos_probs = torch.sigmoid(pooled_logits)
-
-        # Calibrated accuracy
-        cal_thresh = pos_probs.float().quantile(y_true.float().mean()).item()
-        cal_preds = pos_probs.gt(cal_thresh).to(torch.int)
+    if pooled_logits is not None:
+        # Calibrated accuracy. Sigmoid is monotonic, so the label-frequency
+        # quantile can be found and applied on the raw logits; only the reported
+        # threshold needs to live in probability space. The threshold is just an
+        # order statistic, so kthvalue (O(N) introselect) beats quantile, which
+        # sorts everything.
+        flat_logits = pooled_logits.float().flatten()
+        k = int(y_true.float().mean().item() * flat_logits.numel())
+        logit_thresh = flat_logits.kthvalue(max(k, 1)).values
+        cal_thresh = torch.sigmoid(logit_thresh).item()
+        cal_preds = pooled_logits.gt(logit_thresh).to(torch.int)
         cal_acc = accuracy_ci(y_true, cal_preds)
 
+        # The ECE is the one consumer that actually needs probabilities.
+        pos_probs = torch.sigmoid(pooled_logits)
         cal = CalibrationError().update(y_true.flatten(), pos_probs.flatten())
         cal_err = cal.compute()
 
@@ -149,5 +174,11 @@ def to_one_hot(labels: Tensor, n_classes: int) -> Tensor:
     Returns:
         Tensor: A one-hot representation tensor of shape (N, n_classes).
     """
+    if n_classes == 2:
+        # In the binary case the one-hot matrix is just (1 - y, y); a broadcast
+        # compare is cheaper than allocating zeros and running scatter_.
+        y = labels.long()
+        return torch.stack((1 - y, y), dim=-1)
+
     one_hot_labels = labels.new_zeros(*labels.shape, n_classes)
     return one_hot_labels.scatter_(-1, labels.unsqueeze(-1).long(), 1)
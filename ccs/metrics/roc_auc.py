@@ -40,33 +40,30 @@ def roc_auc(y_true: Tensor, y_pred: Tensor) -> Tensor:
     if y_true.dim() not in (1, 2):
         raise ValueError("y_true and y_pred should be 1D or 2D tensors")
 
-    # Sort y_pred in descending order and get indices
-    indices = y_pred.argsort(descending=True, dim=-1)
-
-    # Reorder y_true based on sorted y_pred indices
-    y_true_sorted = y_true.gather(-1, indices)
+    # We use the Mann-Whitney U identity AUC = (R_pos - n_pos * (n_pos + 1) / 2) /
+    # (n_pos * n_neg), where R_pos is the sum of the ranks of the positive samples.
+    # This only needs a sort and a couple of reductions, instead of materializing
+    # the full TPR/FPR curves.
+    y_pred_sorted, order = y_pred.sort(dim=-1)
+    y_true_sorted = y_true.gather(-1, order)
+
+    # Accumulate ranks in at least float32: the rank sum grows like n^2 / 2, which
+    # overflows float16 for n in the hundreds and loses whole ranks in bfloat16.
+    dtype = torch.float64 if y_pred.dtype == torch.float64 else torch.float32
+
+    # Average the 1-based ranks across tied scores, so that ties contribute the
+    # diagonal segments of the ROC curve just like scikit-learn.
+    left = torch.searchsorted(y_pred_sorted, y_pred_sorted, side="left")
+    right = torch.searchsorted(y_pred_sorted, y_pred_sorted, side="right")
+    ranks = (left + right + 1).to(dtype) / 2
 
     # Calculate number of positive and negative samples
     num_positives = y_true.sum(dim=-1)
     num_negatives = y_true.shape[-1] - num_positives
 
-    # Calculate cumulative sum of true positive counts (TPs)
-    tps = torch.cumsum(y_true_sorted, dim=-1)
-
-    # Calculate cumulative sum of false positive counts (FPs)
-    fps = torch.cumsum(1 - y_true_sorted, dim=-1)
-
-    # Calculate true positive rate (TPR) and false positive rate (FPR)
-    tpr = tps / num_positives.view(-1, 1)
-    fpr = fps / num_negatives.view(-1, 1)
-
-    # Calculate differences between consecutive FPR values (widths of trapezoids)
-    fpr_diffs = torch.cat(
-        [fpr[..., 1:] - fpr[..., :-1], torch.zeros_like(fpr[..., :1])], dim=-1
-    )
-
-    # Calculate area under the ROC curve for each dataset using trapezoidal rule
-    return torch.sum(tpr * fpr_diffs, dim=-1).squeeze()
+    pos_rank_sum = torch.sum(y_true_sorted.to(dtype) * ranks, dim=-1)
+    correction = num_positives * (num_positives + 1) / 2
+    return ((pos_rank_sum - correction) / (num_positives * num_negatives)).squeeze()
 
 
 def roc_auc_ci(
@@ -124,9 +121,13 @@ def roc_auc_ci(
     # NaN values due to the fact that they have only one class.
     alpha = (1 - level) / 2
     q = bootstrap_aucs.new_tensor([alpha, 1 - alpha])
-    lower, upper = bootstrap_aucs.nanquantile(q).tolist()
+    bounds = bootstrap_aucs.nanquantile(q)
 
     # Compute the point estimate. Call flatten to ensure that we get a single number
     # computed across cluster boundaries even if the inputs were clustered.
-    estimate = roc_auc(y_true.flatten(), y_pred.flatten()).item()
+    estimate = roc_auc(y_true.flatten(), y_pred.flatten())
+
+    # Fetch the estimate and both bounds in a single device-to-host transfer,
+    # instead of forcing three separate synchronizations.
+    estimate, lower, upper = torch.cat([estimate.view(1), bounds]).tolist()
     return RocAucResult(estimate, lower, upper)
@@ -1,11 +1,18 @@
-import os
 import random
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from dataclasses import dataclass
 from functools import partial
+from itertools import count
 from pathlib import Path
-from typing import Callable, Literal
+from typing import Callable, ClassVar, Literal
 
 import numpy as np
 import pandas as pd
@@ -31,6 +38,25 @@ from .utils import (
 )
 
 
+# Workers get an explicit rank from the executor's initializer; hashing the
+# thread or process id into [0, world_size) can collide, stacking workers on
+# one device while others sit idle.
+_WORKER_RANK = threading.local()
+_PROCESS_RANK: int | None = None
+
+
+def _assign_thread_rank(counter: "count[int]") -> None:
+    _WORKER_RANK.value = next(counter)
+
+
+def _assign_process_rank(counter) -> None:
+    """Claim a rank from a `multiprocessing.Value` shared by all workers."""
+    global _PROCESS_RANK
+    with counter.get_lock():
+        _PROCESS_RANK = counter.value
+        counter.value += 1
+
+
 @dataclass
 class LayerData:
     hiddens: Tensor
@@ -73,6 +99,10 @@ class Run(ABC, Serializable):
     out_dir: Path | None = None
     disable_cache: bool = field(default=False, to_dict=False)
 
+    # True when `apply_to_layer` seeds and draws from the process-global RNGs,
+    # in which case each worker needs its own process (see `apply_to_layers`).
+    seeds_global_rngs: ClassVar[bool] = False
+
     def execute(
         self,
         highlight_color: Color = "cyan",
@@ -137,10 +167,12 @@ class Run(ABC, Serializable):
         torch.manual_seed(seed)
 
     def get_device(self, devices, world_size: int) -> str:
-        """Get the device for the current process."""
+        """Get the device assigned to the current worker."""
 
-        rank = os.getpid() % world_size
-        device = devices[rank]
+        rank = getattr(_WORKER_RANK, "value", _PROCESS_RANK)
+        if rank is None:
+            rank = 0
+        device = devices[rank % world_size]
         return device
 
     def prepare_data(
@@ -159,10 +191,15 @@ class Run(ABC, Serializable):
                 "torch", device=device, dtype=torch.int16, columns=hidden_cols
             )
             # hiddens shape: (num_examples, num_variants, hidden_d)
-            hiddens = int16_to_float32(assert_type(Tensor, split[f"hidden_{layer}"]))
+            hiddens = assert_type(Tensor, split[f"hidden_{layer}"])
             if self.prompt_indices:
                 hiddens = hiddens[:, self.prompt_indices]
 
+            # Upcast only after slicing, so we never materialize float32 copies
+            # of variants we're about to throw away. The int16 storage is just
+            # float16 bits, so everything up to here moves half the bytes.
+            hiddens = int16_to_float32(hiddens)
+
             # convert the remaining columns to torch
             split = split.with_format("torch", device=device)
             labels = assert_type(Tensor, split["label"])
@@ -211,28 +248,56 @@ class Run(ABC, Serializable):
         if self.concatenated_layer_offset > 0:
             layers = self.concatenate(layers)
 
-        ctx = mp.get_context("spawn")
-        with ctx.Pool(num_devices) as pool:
-            mapper = pool.imap_unordered if num_devices > 1 else map
-            df_buffers = defaultdict(list)
+        # One worker per device. Evaluation workers are threads: they share the
+        # parent's address space, so the memory-mapped datasets are visible to
+        # every worker without being re-pickled. Training seeds the
+        # process-global RNGs per layer, so its workers each get a private
+        # spawned process instead — concurrent layers in one process would
+        # clobber each other's seeds and make results depend on thread timing.
+        if self.seeds_global_rngs and num_devices > 1:
+            ctx = mp.get_context("spawn")
+            executor: Executor = ProcessPoolExecutor(
+                num_devices,
+                mp_context=ctx,
+                initializer=_assign_process_rank,
+                initargs=(ctx.Value("i", 0),),
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                num_devices, initializer=_assign_thread_rank, initargs=(count(),)
+            )
+
+        with executor:
+            csv_names: set[str] = set()
             logprobs_dicts = defaultdict(dict)
 
             try:
-                for df_dict, logprobs_dict in tqdm(
-                    mapper(func, layers), total=len(layers)
-                ):
+                futures = [executor.submit(func, layer) for layer in layers]
+                for future in tqdm(as_completed(futures), total=len(layers)):
+                    df_dict, logprobs_dict = future.result()
                     # get arbitrary value
                     df_ = next(iter(df_dict.values()))
                     layer = df_["layer"].iloc[0]
                     for k, v in df_dict.items():
-                        df_buffers[k].append(v)
+                        # Append each layer's rows as soon as they arrive, so
+                        # partial results are on disk if we crash or get
+                        # interrupted and peak memory stays O(1) in the number
+                        # of layers.
+                        v.round(4).to_csv(
+                            self.out_dir / f"{k}.csv",
+                            index=False,
+                            mode="a" if k in csv_names else "w",
+                            header=k not in csv_names,
+                        )
+                        csv_names.add(k)
                     for k, v in logprobs_dict.items():
                         logprobs_dicts[k][layer] = logprobs_dict[k]
             finally:
-                # Make sure the CSVs are written even if we crash or get interrupted
-                for name, dfs in df_buffers.items():
-                    df = pd.concat(dfs).sort_values(by=["layer", "ensembling"])
-                    df.round(4).to_csv(self.out_dir / f"{name}.csv", index=False)
+                # Layers finish out of order; rewrite each CSV in sorted order.
+                for name in csv_names:
+                    path = self.out_dir / f"{name}.csv"
+                    df = pd.read_csv(path).sort_values(by=["layer", "ensembling"])
+                    df.to_csv(path, index=False)
                 if self.debug:
                     save_debug_log(self.datasets, self.out_dir)
                 if self.save_logprobs:
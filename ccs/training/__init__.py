@@ -1,4 +1,4 @@
-from .ccs_reporter import CcsConfig, CcsReporter
+from .ccs_reporter import CcsConfig, CcsReporter, load_reporter
 from .classifier import Classifier
 from .common import FitterConfig
 from .eigen_reporter import EigenFitter, EigenFitterConfig
@@ -12,4 +12,5 @@ __all__ = [
     "EigenFitterConfig",
     "FitterConfig",
     "PlattMixin",
+    "load_reporter",
 ]
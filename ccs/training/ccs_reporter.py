@@ -3,6 +3,7 @@
 import math
 from copy import deepcopy
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Literal, Optional, cast
 
 import torch
@@ -14,7 +15,7 @@ from typing_extensions import override
 from ..parsing import parse_loss
 from ..utils.typing import assert_type
 from .burns_norm import BurnsNorm
-from .common import FitterConfig
+from .common import FitterConfig, Reporter
 from .losses import LOSSES
 from .platt_scaling import PlattMixin
 
@@ -201,7 +202,10 @@ class CcsReporter(nn.Module, PlattMixin):
         Returns:
             best_loss: The best loss obtained.
         """
-        x_neg, x_pos = hiddens.unbind(2)
+        # unbind returns strided views over the (n, v, k, d) tensor; repack each
+        # class densely so the many epochs of probe forward passes below read
+        # contiguous rows instead of striding over the interleaved classes.
+        x_neg, x_pos = (x.contiguous() for x in hiddens.unbind(2))
 
         # One-hot indicators for each prompt template
         n, v, d = x_neg.shape
@@ -309,3 +313,49 @@ class CcsReporter(nn.Module, PlattMixin):
 
         optimizer.step(closure)
         return float(loss)
+
+    def save(self, path: Path | str):
+        """Save a checkpoint loadable with `load_reporter`.
+
+        Only the state dict and the few constructor arguments are serialized,
+        not the module graph itself. The fitted norm is stored separately
+        because a LEACE eraser is a plain dataclass, not a submodule, so it
+        never appears in the state dict.
+        """
+        torch.save(
+            {
+                "config": self.config,
+                "in_features": self.in_features,
+                "num_variants": self.num_variants,
+                "norm": self.norm,
+                "state_dict": self.state_dict(),
+            },
+            path,
+        )
+
+
+def load_reporter(
+    path: Path | str, map_location: str | torch.device | None = None
+) -> "CcsReporter | Reporter":
+    """Load a reporter checkpoint saved by `Elicit`.
+
+    CCS reporters are saved via `CcsReporter.save`; eigen reporters, and CCS
+    checkpoints from before the state-dict format, are pickled whole and
+    returned as-is.
+    """
+    # These are trusted checkpoints written by our own training run, and the
+    # payload includes pickled config/norm objects that the weights-only
+    # unpickler (the default since torch 2.6) refuses to load.
+    payload = torch.load(path, map_location=map_location, weights_only=False)
+    if not isinstance(payload, dict) or "state_dict" not in payload:
+        return payload
+
+    reporter = CcsReporter(
+        payload["config"],
+        payload["in_features"],
+        device=map_location,
+        num_variants=payload["num_variants"],
+    )
+    reporter.norm = payload["norm"]
+    reporter.load_state_dict(payload["state_dict"])
+    return reporter
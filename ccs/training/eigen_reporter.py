@@ -166,34 +166,30 @@ class EigenFitter:
             # CRC-TPC style
             centroids = rearrange(hiddens, "n v k d -> (n v) k d")
 
-        deltas, deltas2 = [], []
-
-        # Iterating over classes
-        for i, h in enumerate(centroids.unbind(1)):
-            # Update the running means
-            delta = h - self.class_means[i]
-            self.class_means[i] += delta.sum(dim=0) / self.n
-
-            # Post-mean update deltas are used to update the (co)variance
-            delta2 = h - self.class_means[i]  # [n, d]
-
-            # *** Variance (inter-cluster) ***
-            # See code at https://bit.ly/3YC9BhH and "Welford's online algorithm"
-            # in https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance.
-            self.intercluster_cov_M2.addmm_(delta.mT, delta2, alpha=1 / k)
-            deltas.append(delta)
-            deltas2.append(delta2)
+        # Update the running means; all classes are updated in one batched op.
+        delta = centroids - self.class_means  # [n, k, d]
+        self.class_means += delta.sum(dim=0) / self.n
+
+        # Post-mean update deltas are used to update the (co)variance
+        delta2 = centroids - self.class_means  # [n, k, d]
+
+        # *** Variance (inter-cluster) ***
+        # See code at https://bit.ly/3YC9BhH and "Welford's online algorithm"
+        # in https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance.
+        # Flattening the batch and class dims lets one matmul compute the sum of
+        # the per-class outer products delta_i^T @ delta2_i.
+        delta_flat = delta.reshape(-1, d)
+        delta2_flat = delta2.reshape(-1, d)
+        diag_sum = delta_flat.mT @ delta2_flat
+        self.intercluster_cov_M2 += diag_sum / k
 
         # *** Negative covariance (contrastive) ***
-        # Iterating over pairs of classes (k, k') where k != k'
-        for i, d in enumerate(deltas):
-            for j, d_ in enumerate(deltas2):
-                # Compare to the other classes only
-                if i == j:
-                    continue
-
-                scale = 1 / (k * (k - 1))
-                self.contrastive_xcov_M2.addmm_(d.mT, d_, alpha=scale)
+        # The sum over pairs of distinct classes (k, k') follows from the identity
+        # sum_{i != j} delta_i^T @ delta2_j
+        #     = (sum_i delta_i)^T @ (sum_j delta2_j) - sum_i delta_i^T @ delta2_i,
+        # which needs two matmuls instead of k * (k - 1).
+        pair_sum = delta.sum(dim=1).mT @ delta2.sum(dim=1) - diag_sum
+        self.contrastive_xcov_M2 += pair_sum / (k * (k - 1))
 
     def fit_streaming(self) -> Reporter:
         """Fit the probe using the current streaming statistics."""
@@ -15,14 +15,27 @@ class PlattMixin(ABC):
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         ...
 
-    def platt_scale(self, labels: Tensor, hiddens: Tensor, max_iter: int = 100):
+    def platt_scale(
+        self, labels: Tensor, hiddens: Tensor, max_iter: int = 100
+    ) -> Tensor:
         """Fit the scale and bias terms to data with LBFGS.
 
         Args:
             labels: Binary labels of shape [batch].
             hiddens: Hidden states of shape [batch, dim].
             max_iter: Maximum number of iterations for LBFGS.
+
+        Returns:
+            The credences on `hiddens` under the fitted scale and bias, so
+            callers evaluating on the same data don't have to rerun the model.
         """
+        # The underlying probe is frozen here; only the scale and bias change.
+        # Run the expensive forward pass once, cache the unscaled scores, and
+        # rescale them inside the closure instead of re-running the network on
+        # every LBFGS iteration.
+        with torch.no_grad():
+            raw_scores = (self(hiddens) - self.bias) / self.scale
+
         opt = optim.LBFGS(
             [self.bias, self.scale],
             line_search_fn="strong_wolfe",
@@ -34,10 +47,13 @@ class PlattMixin(ABC):
         def closure():
             opt.zero_grad()
             loss = nn.functional.binary_cross_entropy_with_logits(
-                self(hiddens), labels.float()
+                raw_scores * self.scale + self.bias, labels.float()
             )
 
             loss.backward()
             return float(loss)
 
         opt.step(closure)
+
+        with torch.no_grad():
+            return raw_scores * self.scale + self.bias
@@ -35,6 +35,9 @@ class Elicit(Run):
     cross-validation. Defaults to "single", which means to train a single classifier
     on the training data. "cv" means to use cross-validation."""
 
+    # apply_to_layer calls make_reproducible, so each worker needs RNG isolation
+    seeds_global_rngs = True
+
     @staticmethod
     def default():
         return Elicit(
@@ -93,39 +96,63 @@ class Elicit(Run):
             reporter = CcsReporter(self.net, d, device=device, num_variants=v)
             train_loss = reporter.fit(first_train_data.hiddens)
             labels = repeat(to_one_hot(first_train_data.labels, k), "n k -> n v k", v=v)
-            reporter.platt_scale(labels, first_train_data.hiddens)
+
+            # Platt scaling already ran the reporter over the training hiddens;
+            # keep the calibrated credences so the eval loop below doesn't
+            # recompute them.
+            (first_ds_name,) = train_dict.keys()
+            train_credences_cache = {
+                first_ds_name: reporter.platt_scale(labels, first_train_data.hiddens)
+            }
 
         elif isinstance(self.net, EigenFitterConfig):
             fitter = EigenFitter(
                 self.net, d, num_classes=k, num_variants=v, device=device
             )
 
-            hidden_list, label_list = [], []
+            # Preallocate the flattened Platt scaling inputs instead of
+            # collecting per-dataset pieces and torch.cat-ing them at the end,
+            # which would briefly hold two copies of every hidden state.
+            total = sum(
+                data.hiddens.shape[0] * data.hiddens.shape[1] * k
+                for data in train_dict.values()
+            )
+            hidden_buf = first_train_data.hiddens.new_empty(total, d)
+            label_buf = torch.empty(total, device=device, dtype=torch.long)
+
+            offset = 0
             for ds_name, train_data in train_dict.items():
-                (_, v, _, _) = train_data.hiddens.shape
+                (n, v, _, _) = train_data.hiddens.shape
 
                 # Datasets can have different numbers of variants, so we need to
                 # flatten them here before concatenating
-                hidden_list.append(
-                    rearrange(train_data.hiddens, "n v k d -> (n v k) d")
-                )
-                label_list.append(
-                    to_one_hot(
-                        repeat(train_data.labels, "n -> (n v)", v=v), k
-                    ).flatten()
+                m = n * v * k
+                hidden_buf[offset : offset + m] = rearrange(
+                    train_data.hiddens, "n v k d -> (n v k) d"
                 )
+                label_buf[offset : offset + m] = to_one_hot(
+                    repeat(train_data.labels, "n -> (n v)", v=v), k
+                ).flatten()
+                offset += m
+
                 fitter.update(train_data.hiddens)
 
             reporter = fitter.fit_streaming()
-            reporter.platt_scale(
-                torch.cat(label_list),
-                torch.cat(hidden_list),
-            )
+
+            # Platt scaling sees the flattened multi-dataset buffer here, so its
+            # credences aren't reusable for the per-dataset eval loop below.
+            reporter.platt_scale(label_buf, hidden_buf)
+            train_credences_cache = {}
         else:
             raise ValueError(f"Unknown reporter config type: {type(self.net)}")
 
-        # Save reporter checkpoint to disk
-        torch.save(reporter, reporter_dir / f"layer_{layer}.pt")
+        # Save reporter checkpoint to disk. CCS reporters get the state-dict
+        # format; eigen reporters are tensor-only dataclasses, so pickling them
+        # whole is already cheap.
+        if isinstance(reporter, CcsReporter):
+            reporter.save(reporter_dir / f"layer_{layer}.pt")
+        else:
+            torch.save(reporter, reporter_dir / f"layer_{layer}.pt")
 
         # Fit supervised logistic regression model
         if self.supervised != "none":
@@ -158,7 +185,19 @@ class Elicit(Run):
                     )
 
                 val_credences = reporter(val.hiddens)
-                train_credences = reporter(train.hiddens)
+                if ds_name in train_credences_cache:
+                    train_credences = train_credences_cache[ds_name]
+                else:
+                    train_credences = reporter(train.hiddens)
+
+                # Compute the supervised credences once per model, not once per
+                # ensembling mode; evaluate_preds doesn't modify its inputs.
+                for model in lr_models:
+                    model.eval()
+                lr_credences = [
+                    (model(val.hiddens), model(train.hiddens)) for model in lr_models
+                ]
+
                 for mode in ("none", "partial", "full"):
                     row_bufs["eval"].append(
                         {
@@ -213,14 +252,12 @@ class Elicit(Run):
                     if self.save_logprobs:
                         out_logprobs[ds_name]["lr"][mode] = dict()
 
-                    for i, model in enumerate(lr_models):
-                        model.eval()
-                        val_credences = model(val.hiddens)
-                        train_credences = model(train.hiddens)
-
+                    for i, (lr_val_credences, lr_train_credences) in enumerate(
+                        lr_credences
+                    ):
                         if self.save_logprobs:
                             out_logprobs[ds_name]["lr"][mode][i] = get_logprobs(
-                                val_credences, mode
+                                lr_val_credences, mode
                             ).cpu()
                         row_bufs["lr_eval"].append(
                             {
@@ -228,7 +265,7 @@ class Elicit(Run):
                                 "ensembling": mode,
                                 "inlp_iter": i,
                                 **evaluate_preds(
-                                    val.labels, val_credences, mode
+                                    val.labels, lr_val_credences, mode
                                 ).to_dict(),
                             }
                         )
@@ -238,7 +275,7 @@ class Elicit(Run):
                                 "ensembling": mode,
                                 "inlp_iter": i,
                                 **evaluate_preds(
-                                    train.labels, train_credences, mode
+                                    train.labels, lr_train_credences, mode
                                 ).to_dict(),
                             }
                         )
@@ -9,7 +9,12 @@ from .data_utils import (
     select_train_val_splits,
 )
 from .gpu_utils import select_usable_devices
-from .hf_utils import instantiate_model, instantiate_tokenizer, is_autoregressive
+from .hf_utils import (
+    get_model_config,
+    instantiate_model,
+    instantiate_tokenizer,
+    is_autoregressive,
+)
 from .math_util import batch_cov, cov_mean_fused, stochastic_round_constrained
 from .pretty import Color, colorize
 from .tree_utils import pytree_map
@@ -24,6 +29,7 @@ __all__ = [
     "float_to_int16",
     "get_columns_all_equal",
     "get_layer_indices",
+    "get_model_config",
     "has_multiple_configs",
     "infer_label_column",
     "infer_num_classes",
@@ -1,3 +1,5 @@
+from functools import cache
+
 import torch
 import transformers
 from transformers import (
@@ -20,6 +22,17 @@ _DECODER_ONLY_SUFFIXES = [
 _AUTOREGRESSIVE_SUFFIXES = ["ConditionalGeneration"] + _DECODER_ONLY_SUFFIXES
 
 
+@cache
+def get_model_config(model_str: str) -> PretrainedConfig:
+    """Load the `AutoConfig` for a model string, caching it for the process.
+
+    The config is consulted several times per run (dtype selection, feature
+    schema, layer counts), and each uncached lookup hits the HF hub or disk.
+    """
+    with prevent_name_conflicts():
+        return AutoConfig.from_pretrained(model_str)
+
+
 def instantiate_model(
     model_str: str,
     device: str | torch.device = "cpu",
@@ -29,8 +42,14 @@ def instantiate_model(
     device = torch.device(device)
     kwargs["device_map"] = {"": device}
 
+    # Stream checkpoint shards straight to the target device instead of
+    # materializing a full fp32 copy in CPU RAM first. This is implied by
+    # device_map on recent transformers versions, but set it explicitly so
+    # every rank loading its own replica keeps peak host memory flat.
+    kwargs.setdefault("low_cpu_mem_usage", True)
+
     with prevent_name_conflicts():
-        model_cfg = AutoConfig.from_pretrained(model_str)
+        model_cfg = get_model_config(model_str)
 
         # When the torch_dtype is None, this generally means the model is fp32, because
         # the config was probably created before the `torch_dtype` field was added.
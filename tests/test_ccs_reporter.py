@@ -0,0 +1,42 @@
+import pytest
+import torch
+
+from ccs.training import CcsConfig, CcsReporter, load_reporter
+
+
+def fit_tiny_reporter(norm: str) -> tuple[CcsReporter, torch.Tensor]:
+    """Fit a small CCS reporter and return it with its training hiddens."""
+    torch.manual_seed(42)
+
+    n, v, d = 16, 2, 8
+    hiddens = torch.randn(n, v, 2, d)
+
+    cfg = CcsConfig(norm=norm, num_epochs=10, num_tries=1)  # type: ignore[arg-type]
+    reporter = CcsReporter(cfg, d, num_variants=v)
+    reporter.fit(hiddens)
+
+    return reporter, hiddens
+
+
+@pytest.mark.parametrize("norm", ["meanonly", "burns", "leace"])
+def test_ccs_reporter_round_trip(tmp_path, norm: str):
+    reporter, hiddens = fit_tiny_reporter(norm)
+
+    path = tmp_path / "layer_0.pt"
+    reporter.save(path)
+
+    loaded = load_reporter(path)
+    assert isinstance(loaded, CcsReporter)
+    torch.testing.assert_close(loaded(hiddens), reporter(hiddens))
+
+
+def test_load_reporter_legacy_pickle(tmp_path):
+    reporter, hiddens = fit_tiny_reporter("meanonly")
+
+    # Reporters used to be pickled whole; load_reporter must keep loading them
+    path = tmp_path / "layer_0.pt"
+    torch.save(reporter, path)
+
+    loaded = load_reporter(path)
+    assert isinstance(loaded, CcsReporter)
+    torch.testing.assert_close(loaded(hiddens), reporter(hiddens))